@@ -3,7 +3,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def simulate_mm1_queue(lambda_, mu, simulation_time):
+def simulate_mm1_queue(lambda_, mu, simulation_time, profile=None):
     env = simpy.Environment()
     stats = {
         'total': 0,
@@ -13,10 +13,16 @@ def simulate_mm1_queue(lambda_, mu, simulation_time):
     }
 
     resource = simpy.Resource(env, capacity=1)
+    rng = np.random
+
+    if profile is not None:
+        rng = profile.rng(np.random)
+        profile.track_environment(env)
+        profile.start(simulation_time)
 
     def generate_requests():
         while True:
-            yield env.timeout(np.random.exponential(1 / lambda_))
+            yield env.timeout(rng.exponential(1 / lambda_))
             stats['total'] += 1
 
             req = resource.request()
@@ -32,7 +38,7 @@ def simulate_mm1_queue(lambda_, mu, simulation_time):
     def process_request(req):
         start_time = env.now
         try:
-            yield env.timeout(np.random.exponential(1 / mu))
+            yield env.timeout(rng.exponential(1 / mu))
         finally:
             stats['busy_time'] += env.now - start_time
             resource.release(req)
@@ -40,6 +46,9 @@ def simulate_mm1_queue(lambda_, mu, simulation_time):
     env.process(generate_requests())
     env.run(until=simulation_time)
 
+    if profile is not None:
+        profile.stop(env.now)
+
     p_loss_theory = lambda_ / (lambda_ + mu)
     utilization_theory = lambda_ / (lambda_ + mu)
 
@@ -54,46 +63,47 @@ def simulate_mm1_queue(lambda_, mu, simulation_time):
     }
 
 
-lambda_ = 5  # Интенсивность входящего потока
-mu = 6  # Интенсивность обслуживания
-simulation_time = 1000
-
-results = simulate_mm1_queue(lambda_, mu, simulation_time)
-
-print("Результаты эксперимента:")
-print(f"Всего заявок: {results['total']}")
-print(f"Обслужено: {results['served']}")
-print(f"Потеряно: {results['lost']}")
-print(f"Вероятность отказа (эксп.): {results['p_loss_exp']:.4f}")
-print(f"Вероятность отказа (теор.): {results['p_loss_theory']:.4f}")
-print(f"Коэффициент загрузки (эксп.): {results['utilization_exp']:.4f}")
-print(f"Коэффициент загрузки (теор.): {results['utilization_theory']:.4f}")
-
-lambdas = np.arange(1, 15, 1)
-mu_fixed = 6
-results_list = [simulate_mm1_queue(l, mu_fixed, simulation_time) for l in lambdas]
-
-p_loss_exp = [res['p_loss_exp'] for res in results_list]
-p_loss_theory = [res['p_loss_theory'] for res in results_list]
-util_exp = [res['utilization_exp'] for res in results_list]
-util_theory = [res['utilization_theory'] for res in results_list]
-
-plt.figure(figsize=(12, 6))
-plt.plot(lambdas, p_loss_exp, 'bo-', label='Экспериментальная')
-plt.plot(lambdas, p_loss_theory, 'r--', label='Теоретическая')
-plt.xlabel('Интенсивность входящего потока (λ)')
-plt.ylabel('Вероятность отказа')
-plt.title('Зависимость вероятности отказа от интенсивности входящего потока')
-plt.legend()
-plt.grid(True)
-plt.show()
-
-plt.figure(figsize=(12, 6))
-plt.plot(lambdas, util_exp, 'go-', label='Экспериментальная')
-plt.plot(lambdas, util_theory, 'r--', label='Теоретическая')
-plt.xlabel('Интенсивность входящего потока (λ)')
-plt.ylabel('Коэффициент загрузки')
-plt.title('Зависимость коэффициента загрузки от интенсивности входящего потока')
-plt.legend()
-plt.grid(True)
-plt.show()
+if __name__ == '__main__':
+    lambda_ = 5  # Интенсивность входящего потока
+    mu = 6  # Интенсивность обслуживания
+    simulation_time = 1000
+
+    results = simulate_mm1_queue(lambda_, mu, simulation_time)
+
+    print("Результаты эксперимента:")
+    print(f"Всего заявок: {results['total']}")
+    print(f"Обслужено: {results['served']}")
+    print(f"Потеряно: {results['lost']}")
+    print(f"Вероятность отказа (эксп.): {results['p_loss_exp']:.4f}")
+    print(f"Вероятность отказа (теор.): {results['p_loss_theory']:.4f}")
+    print(f"Коэффициент загрузки (эксп.): {results['utilization_exp']:.4f}")
+    print(f"Коэффициент загрузки (теор.): {results['utilization_theory']:.4f}")
+
+    lambdas = np.arange(1, 15, 1)
+    mu_fixed = 6
+    results_list = [simulate_mm1_queue(l, mu_fixed, simulation_time) for l in lambdas]
+
+    p_loss_exp = [res['p_loss_exp'] for res in results_list]
+    p_loss_theory = [res['p_loss_theory'] for res in results_list]
+    util_exp = [res['utilization_exp'] for res in results_list]
+    util_theory = [res['utilization_theory'] for res in results_list]
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(lambdas, p_loss_exp, 'bo-', label='Экспериментальная')
+    plt.plot(lambdas, p_loss_theory, 'r--', label='Теоретическая')
+    plt.xlabel('Интенсивность входящего потока (λ)')
+    plt.ylabel('Вероятность отказа')
+    plt.title('Зависимость вероятности отказа от интенсивности входящего потока')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(lambdas, util_exp, 'go-', label='Экспериментальная')
+    plt.plot(lambdas, util_theory, 'r--', label='Теоретическая')
+    plt.xlabel('Интенсивность входящего потока (λ)')
+    plt.ylabel('Коэффициент загрузки')
+    plt.title('Зависимость коэффициента загрузки от интенсивности входящего потока')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -41,11 +41,19 @@ def calculate_characteristics(lambd, mu, n):
     }
 
 
-def simulate_mmn_queue(lambd, mu, n, simulation_time):
+def simulate_mmn_queue(lambd, mu, n, simulation_time, profile=None):
     time = 0.0
     servers_busy = 0
     queue = []
     events = []
+    rng = random
+    scheduler = heapq
+
+    if profile is not None:
+        queue = profile.queue('queue')
+        rng = profile.rng(random)
+        scheduler = profile.scheduler()
+        profile.start(simulation_time)
 
     total_customers = 0
     customers_served = 0
@@ -55,11 +63,11 @@ def simulate_mmn_queue(lambd, mu, n, simulation_time):
     time_all_idle = 0.0
     last_event_time = 0.0
 
-    first_arrival = random.expovariate(lambd)
-    heapq.heappush(events, (first_arrival, 'arrival', None))
+    first_arrival = rng.expovariate(lambd)
+    scheduler.heappush(events, (first_arrival, 'arrival', None))
 
     while events:
-        current_time, event_type, event_data = heapq.heappop(events)
+        current_time, event_type, event_data = scheduler.heappop(events)
         if current_time > simulation_time:
             break
 
@@ -76,15 +84,15 @@ def simulate_mmn_queue(lambd, mu, n, simulation_time):
             arrival_time = current_time
             if servers_busy < n:
                 servers_busy += 1
-                service_time = random.expovariate(mu)
-                heapq.heappush(events, (current_time + service_time, 'departure', (arrival_time, service_time)))
+                service_time = rng.expovariate(mu)
+                scheduler.heappush(events, (current_time + service_time, 'departure', (arrival_time, service_time)))
             else:
                 queue.append(arrival_time)
                 customers_queued += 1
 
-            next_arrival = current_time + random.expovariate(lambd)
+            next_arrival = current_time + rng.expovariate(lambd)
             if next_arrival <= simulation_time:
-                heapq.heappush(events, (next_arrival, 'arrival', None))
+                scheduler.heappush(events, (next_arrival, 'arrival', None))
 
         elif event_type == 'departure':
             customers_served += 1
@@ -94,14 +102,17 @@ def simulate_mmn_queue(lambd, mu, n, simulation_time):
 
             if queue:
                 next_arrival_time = queue.pop(0)
-                service_time_next = random.expovariate(mu)
-                heapq.heappush(events,
-                               (current_time + service_time_next, 'departure', (next_arrival_time, service_time_next)))
+                service_time_next = rng.expovariate(mu)
+                scheduler.heappush(events,
+                                   (current_time + service_time_next, 'departure', (next_arrival_time, service_time_next)))
             else:
                 servers_busy -= 1
 
         time = current_time
 
+    if profile is not None:
+        profile.stop(simulation_time)
+
     P0 = time_all_idle / simulation_time if simulation_time > 0 else 0
     P_queued = customers_queued / total_customers if total_customers > 0 else 0
     Lq = total_queue_length / simulation_time if simulation_time > 0 else 0
@@ -119,66 +130,67 @@ def simulate_mmn_queue(lambd, mu, n, simulation_time):
     }
 
 
-lambd = 10  # заявок/час
-mu = 3  # заявок/час на канал
-n = 4
-simulation_time = 100000
-
-# Теоретические расчеты
-theoretical = calculate_characteristics(lambd, mu, n)
-
-# Имитационное моделирование
-simulated = simulate_mmn_queue(lambd, mu, n, simulation_time)
-
-print("Теоретические характеристики при n=4, μ=3:")
-for key, value in theoretical.items():
-    print(f"{key}: {value:.4f}")
-
-print("\nИмитационные характеристики при n=4, μ=3:")
-for key, value in simulated.items():
-    print(f"{key}: {value:.4f}")
-
-print("\nСравнение результатов:")
-print("{:<10} {:<15} {:<15} {:<10}".format('Характ.', 'Теория', 'Симуляция', 'Разница (%)'))
-for key in theoretical:
-    if key in simulated:
-        th = theoretical[key]
-        sim = simulated[key]
-        diff = abs((th - sim) / th) * 100 if th != 0 else 0
-        print("{:<10} {:<15.4f} {:<15.4f} {:<10.2f}%".format(key, th, sim, diff))
-
-n_values = range(4, 11)
-wq_theory = []
-lq_theory = []
-wq_sim = []
-lq_sim = []
-
-for n in n_values:
-    # Теория
-    chars = calculate_characteristics(lambd, mu, n)
-    wq_theory.append(chars['Wq'])
-    lq_theory.append(chars['Lq'])
-
-    # Симуляция
-    sim = simulate_mmn_queue(lambd, mu, n, simulation_time)
-    wq_sim.append(sim['Wq'])
-    lq_sim.append(sim['Lq'])
-
-plt.figure(figsize=(12, 6))
-plt.subplot(1, 2, 1)
-plt.plot(n_values, wq_theory, 'o-', label='Теория')
-plt.plot(n_values, wq_sim, 'x--', label='Симуляция')
-plt.xlabel('Количество каналов (n)')
-plt.ylabel('Wq (часы)')
-plt.title('Среднее время ожидания')
-plt.legend()
-
-plt.subplot(1, 2, 2)
-plt.plot(n_values, lq_theory, 'o-', label='Теория')
-plt.plot(n_values, lq_sim, 'x--', label='Симуляция')
-plt.xlabel('Количество каналов (n)')
-plt.ylabel('Lq (заявки)')
-plt.title('Средняя длина очереди')
-plt.legend()
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+if __name__ == '__main__':
+    lambd = 10  # заявок/час
+    mu = 3  # заявок/час на канал
+    n = 4
+    simulation_time = 100000
+
+    # Теоретические расчеты
+    theoretical = calculate_characteristics(lambd, mu, n)
+
+    # Имитационное моделирование
+    simulated = simulate_mmn_queue(lambd, mu, n, simulation_time)
+
+    print("Теоретические характеристики при n=4, μ=3:")
+    for key, value in theoretical.items():
+        print(f"{key}: {value:.4f}")
+
+    print("\nИмитационные характеристики при n=4, μ=3:")
+    for key, value in simulated.items():
+        print(f"{key}: {value:.4f}")
+
+    print("\nСравнение результатов:")
+    print("{:<10} {:<15} {:<15} {:<10}".format('Характ.', 'Теория', 'Симуляция', 'Разница (%)'))
+    for key in theoretical:
+        if key in simulated:
+            th = theoretical[key]
+            sim = simulated[key]
+            diff = abs((th - sim) / th) * 100 if th != 0 else 0
+            print("{:<10} {:<15.4f} {:<15.4f} {:<10.2f}%".format(key, th, sim, diff))
+
+    n_values = range(4, 11)
+    wq_theory = []
+    lq_theory = []
+    wq_sim = []
+    lq_sim = []
+
+    for n in n_values:
+        # Теория
+        chars = calculate_characteristics(lambd, mu, n)
+        wq_theory.append(chars['Wq'])
+        lq_theory.append(chars['Lq'])
+
+        # Симуляция
+        sim = simulate_mmn_queue(lambd, mu, n, simulation_time)
+        wq_sim.append(sim['Wq'])
+        lq_sim.append(sim['Lq'])
+
+    plt.figure(figsize=(12, 6))
+    plt.subplot(1, 2, 1)
+    plt.plot(n_values, wq_theory, 'o-', label='Теория')
+    plt.plot(n_values, wq_sim, 'x--', label='Симуляция')
+    plt.xlabel('Количество каналов (n)')
+    plt.ylabel('Wq (часы)')
+    plt.title('Среднее время ожидания')
+    plt.legend()
+
+    plt.subplot(1, 2, 2)
+    plt.plot(n_values, lq_theory, 'o-', label='Теория')
+    plt.plot(n_values, lq_sim, 'x--', label='Симуляция')
+    plt.xlabel('Количество каналов (n)')
+    plt.ylabel('Lq (заявки)')
+    plt.title('Средняя длина очереди')
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
\ No newline at end of file
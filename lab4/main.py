@@ -5,7 +5,7 @@ import pandas as pd
 
 
 class Simulation:
-    def __init__(self, lambda1, lambda2, mu):
+    def __init__(self, lambda1, lambda2, mu, profile=None):
         self.lambda1 = lambda1  # Интенсивность высокоприоритетных заявок
         self.lambda2 = lambda2  # Интенсивность низкоприоритетных заявок
         self.mu = mu            # Интенсивность обслуживания
@@ -27,27 +27,40 @@ class Simulation:
         self.current_time = 0.0
         self.server_busy = False    # Занят ли сервер
 
+        # Профилирование: при profile=None используются обычные numpy и heapq
+        self.profile = profile
+        self.rng = np.random
+        self.scheduler = heapq
+        if profile is not None:
+            self.queue_high = profile.queue('high')
+            self.queue_low = profile.queue('low')
+            self.rng = profile.rng(np.random)
+            self.scheduler = profile.scheduler()
+
     def schedule_event(self, event_time, event_type):
-        heapq.heappush(self.events, (event_time, event_type))
+        self.scheduler.heappush(self.events, (event_time, event_type))
 
     def run(self, max_events):
+        if self.profile is not None:
+            self.profile.start()
+
         # Начальные события: первые заявки каждого класса
-        first_arrival_high = np.random.exponential(1 / self.lambda1)
+        first_arrival_high = self.rng.exponential(1 / self.lambda1)
         self.schedule_event(first_arrival_high, 'arrival_high')
-        first_arrival_low = np.random.exponential(1 / self.lambda2)
+        first_arrival_low = self.rng.exponential(1 / self.lambda2)
         self.schedule_event(first_arrival_low, 'arrival_low')
 
         event_count = 0
         while event_count < max_events and self.events:
-            current_time, event_type = heapq.heappop(self.events)
+            current_time, event_type = self.scheduler.heappop(self.events)
             self.current_time = current_time
 
             if event_type == 'arrival_high':
                 # Генерация следующей высокоприоритетной заявки
-                next_arrival = current_time + np.random.exponential(1 / self.lambda1)
+                next_arrival = current_time + self.rng.exponential(1 / self.lambda1)
                 self.schedule_event(next_arrival, 'arrival_high')
                 # Обработка текущей заявки
-                service_time = np.random.exponential(1 / self.mu)
+                service_time = self.rng.exponential(1 / self.mu)
                 if self.server_busy:
                     self.queue_high.append((current_time, service_time))
                 else:
@@ -59,10 +72,10 @@ class Simulation:
 
             elif event_type == 'arrival_low':
                 # Генерация следующей низкоприоритетной заявки
-                next_arrival = current_time + np.random.exponential(1 / self.lambda2)
+                next_arrival = current_time + self.rng.exponential(1 / self.lambda2)
                 self.schedule_event(next_arrival, 'arrival_low')
                 # Обработка текущей заявки
-                service_time = np.random.exponential(1 / self.mu)
+                service_time = self.rng.exponential(1 / self.mu)
                 if self.server_busy:
                     self.queue_low.append((current_time, service_time))
                 else:
@@ -93,6 +106,9 @@ class Simulation:
 
             event_count += 1
 
+        if self.profile is not None:
+            self.profile.stop(self.current_time)
+
     def get_stats(self):
         stats = {
             'avg_wait1': self.total_wait_high / self.num_served_high if self.num_served_high > 0 else 0,
@@ -102,62 +118,64 @@ class Simulation:
         }
         return stats
 
-# Вариация λ1 при λ2=5, μ=10
-lambda1_values = np.linspace(1, 4, 10)
-lambda2 = 5
-mu = 10
-Wq1_theory_list = []
-Wq2_theory_list = []
-Wq1_sim_list = []
-Wq2_sim_list = []
-results = []
-
-for lambda1 in lambda1_values:
-    # Теоретические расчеты
-    rho1 = lambda1 / mu
-    rho2 = lambda2 / mu
-    Wq1 = (lambda1 + lambda2) / (mu ** 2 * (1 - rho1))
-    Wq2 = (lambda1 + lambda2) / (mu ** 2 * (1 - rho1 - 0.5) * (1 - rho1))
-    Wq1_theory_list.append(Wq1)
-    Wq2_theory_list.append(Wq2)
-
-    # Симуляция
-    sim = Simulation(lambda1, lambda2, mu)
-    sim.run(100000)
-    stats = sim.get_stats()
-    Wq1_sim_list.append(stats['avg_wait1'])
-    Wq2_sim_list.append(stats['avg_wait2'])
-    results.append({
-        'λ₁': lambda1,
-        'Wq1 (теория)': Wq1,
-        'Wq1 (симуляция)': stats['avg_wait1'],
-        'Вероятность ожидания 1 (теория)': rho1,
-        'Вероятность ожидания 1 (симуляция)': stats['prob_wait1'],
-        'Wq2 (теория)': Wq2,
-        'Wq2 (симуляция)': stats['avg_wait2'],
-        'Вероятность ожидания 2 (теория)': rho2 / (1 - rho1),
-        'Вероятность ожидания 2 (симуляция)': stats['prob_wait2'],
-    })
-
-print("Результаты симуляции:")
-print(f"Среднее время ожидания (класс 1): {stats['avg_wait1']:.3f} ч")
-print(f"Среднее время ожидания (класс 2): {stats['avg_wait2']:.3f} ч")
-print(f"Вероятность ожидания (класс 1): {stats['prob_wait1']:.2%}")
-print(f"Вероятность ожидания (класс 2): {stats['prob_wait2']:.2%}")
-plt.figure(figsize=(10, 6))
-plt.plot(lambda1_values, Wq1_theory_list, label='Теория (Класс 1)')
-plt.plot(lambda1_values, Wq1_sim_list, '--', label='Симуляция (Класс 1)')
-plt.plot(lambda1_values, Wq2_theory_list, label='Теория (Класс 2)')
-plt.plot(lambda1_values, Wq2_sim_list, '--', label='Симуляция (Класс 2)')
-plt.xlabel('λ₁ (заявок/час)')
-plt.ylabel('Среднее время ожидания (ч)')
-plt.legend()
-plt.title('Зависимость времени ожидания от интенсивности λ₁')
-plt.grid(True)
-plt.show()
-
-df = pd.DataFrame(results)
-df = df.round(4)
-
-print("\nТаблица характеристик системы:")
-print(df.to_string(index=False))
\ No newline at end of file
+
+if __name__ == '__main__':
+    # Вариация λ1 при λ2=5, μ=10
+    lambda1_values = np.linspace(1, 4, 10)
+    lambda2 = 5
+    mu = 10
+    Wq1_theory_list = []
+    Wq2_theory_list = []
+    Wq1_sim_list = []
+    Wq2_sim_list = []
+    results = []
+
+    for lambda1 in lambda1_values:
+        # Теоретические расчеты
+        rho1 = lambda1 / mu
+        rho2 = lambda2 / mu
+        Wq1 = (lambda1 + lambda2) / (mu ** 2 * (1 - rho1))
+        Wq2 = (lambda1 + lambda2) / (mu ** 2 * (1 - rho1 - 0.5) * (1 - rho1))
+        Wq1_theory_list.append(Wq1)
+        Wq2_theory_list.append(Wq2)
+
+        # Симуляция
+        sim = Simulation(lambda1, lambda2, mu)
+        sim.run(100000)
+        stats = sim.get_stats()
+        Wq1_sim_list.append(stats['avg_wait1'])
+        Wq2_sim_list.append(stats['avg_wait2'])
+        results.append({
+            'λ₁': lambda1,
+            'Wq1 (теория)': Wq1,
+            'Wq1 (симуляция)': stats['avg_wait1'],
+            'Вероятность ожидания 1 (теория)': rho1,
+            'Вероятность ожидания 1 (симуляция)': stats['prob_wait1'],
+            'Wq2 (теория)': Wq2,
+            'Wq2 (симуляция)': stats['avg_wait2'],
+            'Вероятность ожидания 2 (теория)': rho2 / (1 - rho1),
+            'Вероятность ожидания 2 (симуляция)': stats['prob_wait2'],
+        })
+
+    print("Результаты симуляции:")
+    print(f"Среднее время ожидания (класс 1): {stats['avg_wait1']:.3f} ч")
+    print(f"Среднее время ожидания (класс 2): {stats['avg_wait2']:.3f} ч")
+    print(f"Вероятность ожидания (класс 1): {stats['prob_wait1']:.2%}")
+    print(f"Вероятность ожидания (класс 2): {stats['prob_wait2']:.2%}")
+    plt.figure(figsize=(10, 6))
+    plt.plot(lambda1_values, Wq1_theory_list, label='Теория (Класс 1)')
+    plt.plot(lambda1_values, Wq1_sim_list, '--', label='Симуляция (Класс 1)')
+    plt.plot(lambda1_values, Wq2_theory_list, label='Теория (Класс 2)')
+    plt.plot(lambda1_values, Wq2_sim_list, '--', label='Симуляция (Класс 2)')
+    plt.xlabel('λ₁ (заявок/час)')
+    plt.ylabel('Среднее время ожидания (ч)')
+    plt.legend()
+    plt.title('Зависимость времени ожидания от интенсивности λ₁')
+    plt.grid(True)
+    plt.show()
+
+    df = pd.DataFrame(results)
+    df = df.round(4)
+
+    print("\nТаблица характеристик системы:")
+    print(df.to_string(index=False))
\ No newline at end of file
@@ -0,0 +1,213 @@
+import heapq
+import os
+import sys
+from collections import defaultdict
+from time import perf_counter
+
+
+class TimedRNG:
+    # Обертка над random / np.random: время всех вызовов идет в profile.rng_time
+    def __init__(self, module, profile):
+        self._module = module
+        self._profile = profile
+
+    def __getattr__(self, name):
+        func = getattr(self._module, name)
+        profile = self._profile
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            value = func(*args, **kwargs)
+            profile.rng_time += perf_counter() - start
+            return value
+
+        setattr(self, name, timed)
+        return timed
+
+
+class CountingHeap:
+    # Замена модуля heapq для календаря событий вида (время, тип, ...).
+    # Календарь максимален непосредственно перед извлечением, поэтому вставка не оборачивается
+    def __init__(self, profile):
+        self._profile = profile
+        self.heappush = heapq.heappush
+
+    def heappop(self, heap):
+        if len(heap) > self._profile.heap_high_water:
+            self._profile.heap_high_water = len(heap)
+        item = heapq.heappop(heap)
+        # Событие за горизонтом моделирования не обрабатывается: на нем цикл завершается
+        if item[0] <= self._profile.horizon:
+            self._profile.events[item[1]] += 1
+        return item
+
+
+class TimedHeap(CountingHeap):
+    def __init__(self, profile):
+        super().__init__(profile)
+        self.heappush = self.timed_heappush
+
+    def timed_heappush(self, heap, item):
+        start = perf_counter()
+        heapq.heappush(heap, item)
+        self._profile.scheduling_time += perf_counter() - start
+
+    def heappop(self, heap):
+        start = perf_counter()
+        item = super().heappop(heap)
+        self._profile.scheduling_time += perf_counter() - start
+        return item
+
+
+class TrackedQueue(list):
+    # Очередь заявок, запоминающая максимальную длину
+    def __init__(self, profile, name):
+        super().__init__()
+        self._profile = profile
+        self._name = name
+
+    def append(self, item):
+        super().append(item)
+        high_water = self._profile.queue_high_water
+        if len(self) > high_water.get(self._name, 0):
+            high_water[self._name] = len(self)
+
+
+class Profile:
+    def __init__(self, timing=False):
+        self.events = defaultdict(int)  # Число обработанных событий по типам (Counter в цикле заметно медленнее)
+        self.heap_high_water = 0        # Максимальный размер календаря событий
+        self.queue_high_water = {}      # Максимальная длина каждой очереди
+        self.wall_time = 0.0
+        self.sim_time = 0.0
+        self.horizon = float('inf')     # События позже горизонта не считаются обработанными
+
+        # Замеры отдельных вызовов: включаются явно, так как сами замедляют прогон в разы
+        self.timing = timing
+        self.rng_time = 0.0             # Время в генераторах случайных чисел
+        self.scheduling_time = 0.0      # Время на операции с календарем событий
+        self.simpy_time = 0.0           # simpy: step() без вложенных ГСЧ и планирования
+        self._started = None
+
+    def rng(self, module):
+        return TimedRNG(module, self) if self.timing else module
+
+    def scheduler(self):
+        return TimedHeap(self) if self.timing else CountingHeap(self)
+
+    def queue(self, name):
+        return TrackedQueue(self, name)
+
+    def track_environment(self, env):
+        # simpy: постановка событий идет через env.schedule, обработка - через env.step.
+        # Календарь читается из env._queue - приватного атрибута simpy (кортежи (время, приоритет, id, событие))
+        schedule, step, queue = env.schedule, env.step, env._queue
+
+        def counted_step():
+            # Как и в CountingHeap, размер календаря снимается перед извлечением события
+            if len(queue) > self.heap_high_water:
+                self.heap_high_water = len(queue)
+            # В момент until simpy обрабатывает только собственное событие остановки, его не считаем
+            if queue and queue[0][0] < self.horizon:
+                self.events[type(queue[0][3]).__name__] += 1
+            step()
+
+        def timed_schedule(event, *args):
+            start = perf_counter()
+            schedule(event, *args)
+            self.scheduling_time += perf_counter() - start
+
+        def timed_step():
+            rng_time, scheduling_time = self.rng_time, self.scheduling_time
+            start = perf_counter()
+            try:
+                counted_step()
+            finally:
+                self.simpy_time += (perf_counter() - start
+                                    - (self.rng_time - rng_time) - (self.scheduling_time - scheduling_time))
+
+        if self.timing:
+            env.schedule = timed_schedule
+        env.step = timed_step if self.timing else counted_step
+
+    def start(self, horizon=float('inf')):
+        self.horizon = horizon
+        self._started = perf_counter()
+
+    def stop(self, sim_time):
+        self.wall_time += perf_counter() - self._started
+        self.sim_time += sim_time
+        self._started = None
+
+    @property
+    def statistics_time(self):
+        # Все остальное: сбор статистики и логика модели (в simpy она выполняется внутри step())
+        return max(self.wall_time - self.rng_time - self.scheduling_time - self.simpy_time, 0.0)
+
+    @property
+    def sim_time_per_wall_second(self):
+        return self.sim_time / self.wall_time if self.wall_time > 0 else float('inf')
+
+    def as_dict(self):
+        profile = {
+            'events': dict(self.events),
+            'heap_high_water': self.heap_high_water,
+            'queue_high_water': dict(self.queue_high_water),
+            'wall_time': self.wall_time,
+            'sim_time': self.sim_time,
+            'sim_time_per_wall_second': self.sim_time_per_wall_second,
+        }
+        if self.timing:
+            profile.update({
+                'rng_time': self.rng_time,
+                'scheduling_time': self.scheduling_time,
+                'simpy_time': self.simpy_time,
+                'statistics_time': self.statistics_time,
+            })
+        return profile
+
+    def report(self):
+        lines = [
+            f"Время работы: {self.wall_time:.3f} с, модельное время: {self.sim_time:.1f} "
+            f"({self.sim_time_per_wall_second:.1f} ед. модельного времени в секунду)",
+        ]
+        if self.timing:
+            lines += [
+                f"  ГСЧ: {self.rng_time:.3f} с, календарь событий: {self.scheduling_time:.3f} с, "
+                + (f"simpy (диспетчеризация и тела процессов): {self.simpy_time:.3f} с, " if self.simpy_time else "")
+                + f"статистика и логика: {self.statistics_time:.3f} с",
+                "  Замер каждого вызова замедляет прогон: время работы и доли включают стоимость самих замеров",
+            ]
+        lines.append(f"  Максимальный размер календаря: {self.heap_high_water}")
+        for name, length in self.queue_high_water.items():
+            lines.append(f"  Максимальная длина очереди '{name}': {length}")
+        for event_type, count in sorted(self.events.items(), key=lambda pair: -pair[1]):
+            lines.append(f"  {event_type}: {count}")
+        return '\n'.join(lines)
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from LAB1.main import simulate_mm1_queue
+    from lab2.main import simulate_mmn_queue
+    from lab3.main import simulate_mm1m_queue
+    from lab4.main import Simulation
+    from lab5.main import simulate_call_center
+
+    runs = {
+        'LAB1 M/M/1/0': lambda profile: simulate_mm1_queue(5, 6, 1000, profile=profile),
+        'lab2 M/M/n': lambda profile: simulate_mmn_queue(10, 3, 4, 100000, profile=profile),
+        'lab3 M/M/1/m': lambda profile: simulate_mm1m_queue(8, 10, 5, 100000, profile=profile),
+        'lab4 приоритеты': lambda profile: Simulation(2, 5, 10, profile=profile).run(100000),
+        'lab5 call-центр': lambda profile: simulate_call_center(10, 3, 1000, profile=profile),
+    }
+
+    # python profiling/main.py --timing - с замерами времени ГСЧ и календаря событий
+    timing = '--timing' in sys.argv
+
+    for name, run in runs.items():
+        profile = Profile(timing=timing)
+        run(profile)
+        print(name)
+        print(profile.report())
+        print()
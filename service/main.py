@@ -0,0 +1,220 @@
+import asyncio
+import inspect
+import math
+import numbers
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LAB1.main import simulate_mm1_queue
+from lab2.main import calculate_characteristics, simulate_mmn_queue
+from lab3.main import calculate_metrics, simulate_mm1m_queue
+from lab4.main import Simulation
+
+
+def simulate_priority_queue(lambda1, lambda2, mu, max_events):
+    sim = Simulation(lambda1, lambda2, mu)
+    sim.run(max_events)
+    return sim.get_stats()
+
+
+# Аналитические модели считаются сразу в цикле событий
+ANALYTIC_MODELS = {
+    'mmn': calculate_characteristics,   # (lambd, mu, n)
+    'mm1m': calculate_metrics,          # (lambd, mu, m)
+}
+
+# Имитационные модели выполняются в пуле процессов
+SIMULATION_MODELS = {
+    'mm1': simulate_mm1_queue,          # (lambda_, mu, simulation_time)
+    'mmn': simulate_mmn_queue,          # (lambd, mu, n, simulation_time)
+    'mm1m': simulate_mm1m_queue,        # (lambd, mu, m, simulation_time)
+    'priority': simulate_priority_queue,  # (lambda1, lambda2, mu, max_events)
+}
+
+# Квантили t-распределения Стьюдента (95%) для 1..30 степеней свободы
+T_QUANTILES_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+
+
+def run_replication(model, params, seed):
+    # Независимый прогон: модели используют глобальные генераторы random и np.random
+    random.seed(seed)
+    np.random.seed(seed)
+    return SIMULATION_MODELS[model](*params)
+
+
+def check_params(models, model, params):
+    if model not in models:
+        raise KeyError(f"Неизвестная модель: {model}")
+    # Необязательные параметры (например, profile) через сервис не передаются
+    names = [param.name for param in inspect.signature(models[model]).parameters.values()
+             if param.default is inspect.Parameter.empty]
+    if len(params) != len(names):
+        raise TypeError(f"Модель {model} ожидает параметры ({', '.join(names)}), передано: {len(params)}")
+    # Параметры входят в ключ дедупликации, поэтому допускаются только числа
+    for name, value in zip(names, params):
+        if isinstance(value, bool) or not isinstance(value, numbers.Real):
+            raise TypeError(f"Параметр {name} модели {model} должен быть числом, передано: {value!r}")
+
+
+def confidence_interval(values):
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, float('inf')
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    t = T_QUANTILES_95[n - 2] if n - 1 <= len(T_QUANTILES_95) else 1.96
+    return mean, t * math.sqrt(variance / n)
+
+
+class SimulationRun:
+    def __init__(self, replications):
+        self.replications = replications
+        self.results = []
+        self.snapshots = []     # Промежуточные оценки после каждого прогона
+        self.done = False
+        self.error = None
+        self.changed = asyncio.Condition()
+        self.task = None        # Задача, выполняющая прогоны
+
+    def snapshot(self):
+        metrics = {}
+        for key in self.results[0]:
+            mean, half_width = confidence_interval([res[key] for res in self.results])
+            metrics[key] = {'mean': mean, 'ci': half_width}
+        return {
+            'completed': len(self.results),
+            'replications': self.replications,
+            'done': len(self.results) == self.replications,
+            'metrics': metrics,
+        }
+
+    async def add(self, result):
+        self.results.append(result)
+        # Оценка публикуется, когда по ней уже можно построить доверительный интервал
+        if len(self.results) < 2:
+            return
+        self.snapshots.append(self.snapshot())
+        async with self.changed:
+            self.changed.notify_all()
+
+    async def finish(self, error=None):
+        self.error = error
+        self.done = True
+        async with self.changed:
+            self.changed.notify_all()
+
+    async def subscribe(self):
+        # Подписчик, пришедший во время прогона, начинает с последней оценки
+        seen = max(len(self.snapshots) - 1, 0)
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(lambda: len(self.snapshots) > seen or self.done)
+            while seen < len(self.snapshots):
+                yield self.snapshots[seen]
+                seen += 1
+            if self.done and seen == len(self.snapshots):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class QueueService:
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        # Не больше max_workers прогонов одновременно передаются в пул
+        self.slots = asyncio.Semaphore(self.max_workers)
+        self.in_flight = {}     # Ключ запроса -> SimulationRun
+
+    async def analytic(self, model, *params):
+        check_params(ANALYTIC_MODELS, model, params)
+        return ANALYTIC_MODELS[model](*params)
+
+    def simulate(self, model, *params, replications=10, seed=0):
+        check_params(SIMULATION_MODELS, model, params)
+        # Для доверительного интервала нужно хотя бы два прогона
+        if isinstance(replications, bool) or not isinstance(replications, int) or replications < 2:
+            raise ValueError(f"Число прогонов должно быть целым и не меньше 2, передано: {replications!r}")
+        if isinstance(seed, bool) or not isinstance(seed, int):
+            raise TypeError(f"seed должен быть целым числом, передано: {seed!r}")
+        key = (model, params, replications, seed)
+        run = self.in_flight.get(key)
+        if run is None:
+            run = SimulationRun(replications)
+            self.in_flight[key] = run
+            run.task = asyncio.create_task(self.execute(key, run))
+        return run.subscribe()
+
+    async def estimate(self, model, *params, replications=10, seed=0):
+        snapshot = None
+        async for snapshot in self.simulate(model, *params, replications=replications, seed=seed):
+            pass
+        return snapshot
+
+    async def execute(self, key, run):
+        model, params, replications, seed = key
+        loop = asyncio.get_running_loop()
+
+        async def replicate(i):
+            async with self.slots:
+                return await loop.run_in_executor(self.executor, run_replication, model, params, seed + i)
+
+        tasks = [asyncio.create_task(replicate(i)) for i in range(replications)]
+        error = None
+        try:
+            for task in asyncio.as_completed(tasks):
+                await run.add(await task)
+        except asyncio.CancelledError:
+            error = RuntimeError("Сервис остановлен до завершения прогонов")
+            raise
+        except Exception as exc:
+            error = exc
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.in_flight.pop(key, None)
+            await run.finish(error)
+
+    async def aclose(self):
+        runs = list(self.in_flight.items())
+        for _, run in runs:
+            run.task.cancel()
+        await asyncio.gather(*(run.task for _, run in runs), return_exceptions=True)
+        # Задача, отмененная до первого шага, не выполняет свой finally: завершаем такие прогоны здесь
+        for key, run in runs:
+            self.in_flight.pop(key, None)
+            if not run.done:
+                await run.finish(RuntimeError("Сервис остановлен до завершения прогонов"))
+        # shutdown блокирует до завершения рабочих процессов, поэтому выполняется вне цикла событий
+        await asyncio.to_thread(self.executor.shutdown, cancel_futures=True)
+
+
+async def demo():
+    service = QueueService(max_workers=4)
+    try:
+        print("Теория M/M/4:", await service.analytic('mmn', 10, 3, 4))
+
+        async def client(name):
+            async for snapshot in service.simulate('mmn', 10, 3, 4, 10000, replications=8):
+                wq = snapshot['metrics']['Wq']
+                print(f"{name}: прогонов {snapshot['completed']}/{snapshot['replications']}, "
+                      f"Wq = {wq['mean']:.4f} ± {wq['ci']:.4f}")
+
+        # Два одинаковых запроса обслуживаются одним набором прогонов
+        await asyncio.gather(client('Клиент 1'), client('Клиент 2'))
+    finally:
+        await service.aclose()
+
+
+if __name__ == '__main__':
+    asyncio.run(demo())
@@ -0,0 +1,138 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lab2.main import calculate_characteristics
+from service.main import QueueService, SimulationRun
+
+
+async def collect(stream):
+    return [snapshot async for snapshot in stream]
+
+
+def test_analytic_is_answered_inline():
+    async def scenario():
+        service = QueueService(max_workers=1)
+        try:
+            return await service.analytic('mmn', 10, 3, 4)
+        finally:
+            await service.aclose()
+
+    assert asyncio.run(scenario()) == calculate_characteristics(10, 3, 4)
+
+
+def test_identical_requests_share_one_run():
+    async def scenario():
+        service = QueueService(max_workers=2)
+        try:
+            first = service.simulate('mm1m', 8, 10, 3, 50, replications=3)
+            second = service.simulate('mm1m', 8, 10, 3, 50, replications=3)
+            assert len(service.in_flight) == 1
+            results = await asyncio.gather(collect(first), collect(second))
+            assert service.in_flight == {}
+            return results
+        finally:
+            await service.aclose()
+
+    first, second = asyncio.run(scenario())
+    assert [snapshot['completed'] for snapshot in first] == [2, 3]
+    assert all(a is b for a, b in zip(first, second))
+    assert first[-1]['done']
+
+
+def test_late_subscriber_starts_from_latest_snapshot():
+    async def scenario():
+        run = SimulationRun(replications=4)
+        for value in (1.0, 2.0, 3.0):
+            await run.add({'x': value})
+        stream = run.subscribe()
+        latest = await stream.__anext__()
+        await run.add({'x': 4.0})
+        await run.finish()
+        return [latest] + await collect(stream)
+
+    snapshots = asyncio.run(scenario())
+    assert [snapshot['completed'] for snapshot in snapshots] == [3, 4]
+    assert snapshots[0]['metrics']['x']['mean'] == pytest.approx(2.0)
+    assert snapshots[-1]['done']
+
+
+def test_error_reaches_every_subscriber():
+    async def scenario():
+        service = QueueService(max_workers=2)
+        try:
+            # За такое модельное время не приходит ни одна заявка: модель делит на ноль
+            streams = [service.simulate('mm1', 5, 6, 1e-9, replications=2) for _ in range(2)]
+            return await asyncio.gather(*(collect(stream) for stream in streams), return_exceptions=True)
+        finally:
+            await service.aclose()
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ZeroDivisionError) for result in results)
+
+
+def test_aclose_releases_subscribers_of_unstarted_run():
+    async def scenario():
+        service = QueueService(max_workers=1)
+        consumer = asyncio.create_task(collect(service.simulate('mmn', 10, 3, 4, 100000, replications=4)))
+        await service.aclose()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(consumer, timeout=3)
+        assert service.in_flight == {}
+
+    asyncio.run(scenario())
+
+
+def test_aclose_releases_subscribers_of_running_run():
+    async def scenario():
+        service = QueueService(max_workers=1)
+        stream = service.simulate('mmn', 10, 3, 4, 50, replications=50)
+        await stream.__anext__()
+        await service.aclose()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(collect(stream), timeout=3)
+        assert service.in_flight == {}
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize('params, kwargs, error', [
+    (('nope', 1), {}, KeyError),
+    (('mmn', 10, 3, 4), {}, TypeError),
+    (('mmn', 10, 3, 4, 100, 'x'), {}, TypeError),
+    (('mmn', 10, 3, [4], 100), {}, TypeError),
+    (('mmn', 10, 3, 4, 100), {'replications': 1}, ValueError),
+    (('mmn', 10, 3, 4, 100), {'seed': 'x'}, TypeError),
+])
+def test_invalid_simulation_requests_are_rejected(params, kwargs, error):
+    async def scenario():
+        service = QueueService(max_workers=1)
+        try:
+            with pytest.raises(error):
+                service.simulate(*params, **kwargs)
+            assert service.in_flight == {}
+        finally:
+            await service.aclose()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize('params, error', [
+    (('nope', 1), KeyError),
+    (('mmn', 10, 3), TypeError),
+    (('mm1m', 8, 10, {'m': 3}), TypeError),
+])
+def test_invalid_analytic_requests_are_rejected(params, error):
+    async def scenario():
+        service = QueueService(max_workers=1)
+        try:
+            with pytest.raises(error):
+                await service.analytic(*params)
+        finally:
+            await service.aclose()
+
+    asyncio.run(scenario())